@@ -1,5 +1,6 @@
 """Unofficial Python SDK for the Tally.so API."""
 
+from tally.cache import CacheBackend, TTLCache
 from tally.client import TallyClient
 from tally.exceptions import (
     BadRequestError,
@@ -21,10 +22,12 @@ Tally = TallyClient
 
 __all__ = [
     "BadRequestError",
+    "CacheBackend",
     "ForbiddenError",
     "NotFoundError",
     "RateLimitError",
     "ServerError",
+    "TTLCache",
     "Tally",
     "TallyAPIError",
     "TallyClient",
@@ -0,0 +1,94 @@
+"""Response caching for the Tally API client."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class CacheBackend(Protocol):
+    """Interface for caches that store form listing responses.
+
+    Implement it to share cached pages between processes (e.g., on top of Redis).
+    Values are plain JSON-compatible dicts, and keys are strings such as
+    `"tally:forms:1:50:"`; the backend decides how long entries live.
+    """
+
+    def get(self, key: str, *, stale: bool = False) -> Any | None:  # noqa: ANN401
+        """Return the cached value for a key, or None on a miss.
+
+        `stale=True` is passed when the API request failed; backends that keep
+        expired entries may return them then.
+        """
+        ...
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a value under a key."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every cached form listing."""
+        ...
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a fixed time-to-live.
+
+    Stores raw API response data so repeated reads (re-iterating forms, asking for
+    the same page twice) don't hit the API again while the entry is fresh.
+
+    With `stale_ttl`, expired entries are kept a while longer so they can still be
+    served as a fallback when the API is unreachable.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 128, stale_ttl: float = 0.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh (default: 30)
+            maxsize: Maximum number of entries; the least recently used is evicted first
+            stale_ttl: Extra seconds an expired entry is kept for stale reads (default: 0)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._entries: OrderedDict[str, tuple[float, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, *, stale: bool = False) -> Any | None:  # noqa: ANN401
+        """Return the cached value for a key, or None if it is missing or expired.
+
+        Args:
+            key: Cache key
+            stale: Also return entries past their TTL that are still within `stale_ttl`
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            fresh_until, expires_at, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+
+            if fresh_until <= now and not stale:
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a value under a key, evicting the least recently used entry if full."""
+        with self._lock:
+            fresh_until = time.monotonic() + self.ttl
+            self._entries[key] = (fresh_until, fresh_until + self.stale_ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
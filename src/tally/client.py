@@ -4,6 +4,12 @@ from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "speedups" extra
+    orjson = None
+
+from tally.cache import CacheBackend
 from tally.exceptions import (
     BadRequestError,
     ForbiddenError,
@@ -36,6 +42,7 @@ class TallyClient:
         api_version: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
         base_url: str | None = None,
+        cache: CacheBackend | None = None,
     ) -> None:
         """Initialize the Tally API client.
 
@@ -44,6 +51,7 @@ class TallyClient:
             api_version: Optional API version (e.g., "2025-02-01")
             timeout: Request timeout in seconds
             base_url: Optional custom base URL (defaults to https://api.tally.so)
+            cache: Optional cache for form listings (e.g., TTLCache(ttl=30)); disabled by default
         """
         self.api_key = api_key
         self.api_version = api_version
@@ -61,7 +69,7 @@ class TallyClient:
         self.organizations = OrganizationsResource(self)
         self.workspaces = WorkspacesResource(self)
         self.webhooks = WebhooksResource(self)
-        self.forms = FormsResource(self)
+        self.forms = FormsResource(self, cache=cache)
 
     def _get_headers(self) -> dict[str, str]:
         """Get default headers for API requests."""
@@ -134,12 +142,22 @@ class TallyClient:
             TallyConnectionError: If there's a connection error
             TallyTimeoutError: If the request times out
         """
+        content = None
+        if json is not None and orjson is not None:
+            try:
+                content = orjson.dumps(json)
+                json = None
+            except TypeError:
+                # Leave anything orjson rejects (e.g. non-str keys) to httpx's encoder
+                content = None
+
         try:
             response = self._client.request(
                 method=method,
                 url=endpoint,
                 params=params,
                 json=json,
+                content=content,
             )
 
             if response.status_code >= 400:
@@ -149,6 +167,9 @@ class TallyClient:
             if response.status_code == 204:
                 return None
 
+            if orjson is not None:
+                return orjson.loads(response.content)
+
             return response.json()
 
         except httpx.TimeoutException as e:
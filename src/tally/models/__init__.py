@@ -1,63 +1,7 @@
 """Models for the Tally API."""
 
-from tally.models.block_payloads import (
-    AllowedFiles,
-    BasePayload,
-    BlockPayload,
-    ButtonSettings,
-    CalculatedField,
-    CalculatedFieldsPayload,
-    CaptchaPayload,
-    CheckboxPayload,
-    Conditional,
-    ConditionalAction,
-    ConditionalLogicPayload,
-    CoverSettings,
-    DividerPayload,
-    DropdownOptionPayload,
-    EmbedAudioPayload,
-    EmbedDisplay,
-    EmbedPayload,
-    EmbedVideoPayload,
-    FileUploadPayload,
-    FormTitlePayload,
-    Heading1Payload,
-    Heading2Payload,
-    Heading3Payload,
-    HiddenField,
-    HiddenFieldsPayload,
-    ImagePayload,
-    ImageSettings,
-    InputDatePayload,
-    InputEmailPayload,
-    InputLinkPayload,
-    InputNumberPayload,
-    InputPhoneNumberPayload,
-    InputTextPayload,
-    InputTimePayload,
-    LabelPayload,
-    LinearScalePayload,
-    MatrixColumnPayload,
-    MatrixPayload,
-    MatrixRowPayload,
-    Mention,
-    MentionField,
-    MultipleChoiceOptionPayload,
-    MultiSelectOptionPayload,
-    OptionPayload,
-    PageBreakPayload,
-    PaymentPayload,
-    QuestionPayload,
-    RankingOptionPayload,
-    RatingPayload,
-    RespondentCountryPayload,
-    SignaturePayload,
-    TextareaPayload,
-    TextPayload,
-    ThankYouPagePayload,
-    TitlePayload,
-    WalletConnectPayload,
-)
+from typing import TYPE_CHECKING, Any
+
 from tally.models.form import (
     BlockType,
     Form,
@@ -92,6 +36,66 @@ from tally.models.webhook import (
 )
 from tally.models.workspace import PaginatedWorkspaces, Workspace, WorkspaceInvite
 
+if TYPE_CHECKING:
+    from tally.models.block_payloads import (
+        AllowedFiles,
+        BasePayload,
+        BlockPayload,
+        ButtonSettings,
+        CalculatedField,
+        CalculatedFieldsPayload,
+        CaptchaPayload,
+        CheckboxPayload,
+        Conditional,
+        ConditionalAction,
+        ConditionalLogicPayload,
+        CoverSettings,
+        DividerPayload,
+        DropdownOptionPayload,
+        EmbedAudioPayload,
+        EmbedDisplay,
+        EmbedPayload,
+        EmbedVideoPayload,
+        FileUploadPayload,
+        FormTitlePayload,
+        Heading1Payload,
+        Heading2Payload,
+        Heading3Payload,
+        HiddenField,
+        HiddenFieldsPayload,
+        ImagePayload,
+        ImageSettings,
+        InputDatePayload,
+        InputEmailPayload,
+        InputLinkPayload,
+        InputNumberPayload,
+        InputPhoneNumberPayload,
+        InputTextPayload,
+        InputTimePayload,
+        LabelPayload,
+        LinearScalePayload,
+        MatrixColumnPayload,
+        MatrixPayload,
+        MatrixRowPayload,
+        Mention,
+        MentionField,
+        MultipleChoiceOptionPayload,
+        MultiSelectOptionPayload,
+        OptionPayload,
+        PageBreakPayload,
+        PaymentPayload,
+        QuestionPayload,
+        RankingOptionPayload,
+        RatingPayload,
+        RespondentCountryPayload,
+        SignaturePayload,
+        TextareaPayload,
+        TextPayload,
+        ThankYouPagePayload,
+        TitlePayload,
+        WalletConnectPayload,
+    )
+
 __all__ = [
     "AllowedFiles",
     "BasePayload",
@@ -182,3 +186,16 @@ __all__ = [
     "Workspace",
     "WorkspaceInvite",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the block payload TypedDicts on first access.
+
+    They are only needed when building block payloads, so loading them lazily keeps
+    them off the ``import tally`` path.
+    """
+    import tally.models.block_payloads as block_payloads
+
+    if name in block_payloads.__all__:
+        return getattr(block_payloads, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,7 @@ IMPORTANT DISTINCTION:
 - Fields without markers can appear in both scenarios
 """
 
-from typing import Any, Literal, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 # ! This code MUST change!! This code sucks!
 # ! This code is trash, i need to think a way to separate request from response models while
@@ -730,53 +730,57 @@ class OptionPayload(BasePayload):
     text: str
 
 
-# Union type for all possible payloads
-BlockPayload = (
-    FormTitlePayload
-    | TextPayload
-    | LabelPayload
-    | TitlePayload
-    | Heading1Payload
-    | Heading2Payload
-    | Heading3Payload
-    | DividerPayload
-    | PageBreakPayload
-    | ThankYouPagePayload
-    | ImagePayload
-    | EmbedPayload
-    | EmbedVideoPayload
-    | EmbedAudioPayload
-    | QuestionPayload
-    | MatrixPayload
-    | InputTextPayload
-    | InputNumberPayload
-    | InputEmailPayload
-    | InputLinkPayload
-    | InputPhoneNumberPayload
-    | InputDatePayload
-    | InputTimePayload
-    | TextareaPayload
-    | FileUploadPayload
-    | LinearScalePayload
-    | RatingPayload
-    | HiddenFieldsPayload
-    | MultipleChoiceOptionPayload
-    | CheckboxPayload
-    | DropdownOptionPayload
-    | RankingOptionPayload
-    | MultiSelectOptionPayload
-    | OptionPayload
-    | PaymentPayload
-    | SignaturePayload
-    | MatrixRowPayload
-    | MatrixColumnPayload
-    | WalletConnectPayload
-    | ConditionalLogicPayload
-    | CalculatedFieldsPayload
-    | CaptchaPayload
-    | RespondentCountryPayload
-    | dict[str, Any]  # Fallback for flexibility
-)
+# Union type for all possible payloads. TypedDicts are purely structural, so the union is
+# only evaluated by type checkers; at runtime every payload is just a dict.
+if TYPE_CHECKING:
+    BlockPayload = (
+        FormTitlePayload
+        | TextPayload
+        | LabelPayload
+        | TitlePayload
+        | Heading1Payload
+        | Heading2Payload
+        | Heading3Payload
+        | DividerPayload
+        | PageBreakPayload
+        | ThankYouPagePayload
+        | ImagePayload
+        | EmbedPayload
+        | EmbedVideoPayload
+        | EmbedAudioPayload
+        | QuestionPayload
+        | MatrixPayload
+        | InputTextPayload
+        | InputNumberPayload
+        | InputEmailPayload
+        | InputLinkPayload
+        | InputPhoneNumberPayload
+        | InputDatePayload
+        | InputTimePayload
+        | TextareaPayload
+        | FileUploadPayload
+        | LinearScalePayload
+        | RatingPayload
+        | HiddenFieldsPayload
+        | MultipleChoiceOptionPayload
+        | CheckboxPayload
+        | DropdownOptionPayload
+        | RankingOptionPayload
+        | MultiSelectOptionPayload
+        | OptionPayload
+        | PaymentPayload
+        | SignaturePayload
+        | MatrixRowPayload
+        | MatrixColumnPayload
+        | WalletConnectPayload
+        | ConditionalLogicPayload
+        | CalculatedFieldsPayload
+        | CaptchaPayload
+        | RespondentCountryPayload
+        | dict[str, Any]  # Fallback for flexibility
+    )
+else:
+    BlockPayload = dict[str, Any]
 
 __all__ = [
     "AllowedFiles",
@@ -3,9 +3,14 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from tally.models.block_payloads import BlockPayload
+if TYPE_CHECKING:
+    from tally.models.block_payloads import BlockPayload
+else:
+    # Runtime alias, mirroring block_payloads, so the payload TypedDicts load lazily
+    BlockPayload = dict[str, Any]
 
 
 class FormStatus(str, Enum):
@@ -72,7 +77,22 @@ class BlockType(str, Enum):
     RESPONDENT_COUNTRY = "RESPONDENT_COUNTRY"
 
 
-@dataclass
+# Value -> member lookups used when decoding API responses
+_FORM_STATUSES: dict[str, FormStatus] = {status.value: status for status in FormStatus}
+_BLOCK_TYPES: dict[str, BlockType] = {block_type.value: block_type for block_type in BlockType}
+
+
+@lru_cache(maxsize=1024)
+def _parse_form_timestamp(value: str) -> datetime:
+    """Parse a form createdAt/updatedAt timestamp.
+
+    Repeated listings return the same timestamps for unchanged forms, so parsed values
+    are memoized (datetimes are immutable and safe to share).
+    """
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class FormPayment:
     """Represents a payment configuration for a form."""
 
@@ -95,7 +115,7 @@ class FormPayment:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FormBlock:
     """Represents a form block element.
 
@@ -119,13 +139,9 @@ class FormBlock:
 
         return cls(
             uuid=data["uuid"],
-            type=BlockType(block_type)
-            if block_type in BlockType.__members__.values()
-            else block_type,
+            type=_BLOCK_TYPES.get(block_type, block_type),
             group_uuid=data["groupUuid"],
-            group_type=BlockType(group_type)
-            if group_type in BlockType.__members__.values()
-            else group_type,
+            group_type=_BLOCK_TYPES.get(group_type, group_type),
             payload=data.get("payload"),
         )
 
@@ -144,7 +160,7 @@ class FormBlock:
         return block_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class FormSettings:
     """Form settings configuration."""
 
@@ -217,11 +233,18 @@ class FormSettings:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to API request format."""
-        settings_dict: dict[str, Any] = {}
+        settings_dict: dict[str, Any] = {
+            "isClosed": self.is_closed,
+            "hasSelfEmailNotifications": self.has_self_email_notifications,
+            "hasRespondentEmailNotifications": self.has_respondent_email_notifications,
+            "hasProgressBar": self.has_progress_bar,
+            "hasPartialSubmissions": self.has_partial_submissions,
+            "pageAutoJump": self.page_auto_jump,
+            "saveForLater": self.save_for_later,
+        }
 
         if self.language is not None:
             settings_dict["language"] = self.language
-        settings_dict["isClosed"] = self.is_closed
         if self.close_message_title is not None:
             settings_dict["closeMessageTitle"] = self.close_message_title
         if self.close_message_description is not None:
@@ -238,7 +261,6 @@ class FormSettings:
             settings_dict["uniqueSubmissionKey"] = self.unique_submission_key
         if self.redirect_on_completion is not None:
             settings_dict["redirectOnCompletion"] = self.redirect_on_completion
-        settings_dict["hasSelfEmailNotifications"] = self.has_self_email_notifications
         if self.self_email_to is not None:
             settings_dict["selfEmailTo"] = self.self_email_to
         if self.self_email_reply_to is not None:
@@ -249,7 +271,6 @@ class FormSettings:
             settings_dict["selfEmailFromName"] = self.self_email_from_name
         if self.self_email_body is not None:
             settings_dict["selfEmailBody"] = self.self_email_body
-        settings_dict["hasRespondentEmailNotifications"] = self.has_respondent_email_notifications
         if self.respondent_email_to is not None:
             settings_dict["respondentEmailTo"] = self.respondent_email_to
         if self.respondent_email_reply_to is not None:
@@ -260,10 +281,6 @@ class FormSettings:
             settings_dict["respondentEmailFromName"] = self.respondent_email_from_name
         if self.respondent_email_body is not None:
             settings_dict["respondentEmailBody"] = self.respondent_email_body
-        settings_dict["hasProgressBar"] = self.has_progress_bar
-        settings_dict["hasPartialSubmissions"] = self.has_partial_submissions
-        settings_dict["pageAutoJump"] = self.page_auto_jump
-        settings_dict["saveForLater"] = self.save_for_later
         if self.styles is not None:
             settings_dict["styles"] = self.styles
         if self.password is not None:
@@ -278,7 +295,26 @@ class FormSettings:
         return settings_dict
 
 
-@dataclass
+def _form_fields(data: dict) -> dict[str, Any]:
+    """Decode the fields shared by Form, FormCreated and FormDetails."""
+    payments = data.get("payments")
+    status = data["status"]
+
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "workspace_id": data["workspaceId"],
+        # FormStatus(status) only runs on a miss, to raise its usual ValueError
+        "status": _FORM_STATUSES.get(status) or FormStatus(status),
+        "number_of_submissions": data["numberOfSubmissions"],
+        "is_closed": data["isClosed"],
+        "created_at": _parse_form_timestamp(data["createdAt"]),
+        "updated_at": _parse_form_timestamp(data["updatedAt"]),
+        "payments": list(map(FormPayment.from_dict, payments)) if payments else None,
+    }
+
+
+@dataclass(slots=True)
 class FormCreated:
     """Response from creating a form."""
 
@@ -295,22 +331,10 @@ class FormCreated:
     @classmethod
     def from_dict(cls, data: dict) -> "FormCreated":
         """Create a FormCreated instance from API response data."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            workspace_id=data["workspaceId"],
-            status=FormStatus(data["status"]),
-            number_of_submissions=data["numberOfSubmissions"],
-            is_closed=data["isClosed"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
-            payments=[FormPayment.from_dict(payment) for payment in data.get("payments", [])]
-            if data.get("payments")
-            else None,
-        )
+        return cls(**_form_fields(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class Form:
     """Represents a Tally form."""
 
@@ -327,19 +351,7 @@ class Form:
     @classmethod
     def from_dict(cls, data: dict) -> "Form":
         """Create a Form instance from API response data."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            workspace_id=data["workspaceId"],
-            status=FormStatus(data["status"]),
-            number_of_submissions=data["numberOfSubmissions"],
-            is_closed=data["isClosed"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
-            payments=[FormPayment.from_dict(payment) for payment in data.get("payments", [])]
-            if data.get("payments")
-            else None,
-        )
+        return cls(**_form_fields(data))
 
 
 @dataclass
@@ -366,23 +378,13 @@ class FormDetails:
     def from_dict(cls, data: dict) -> "FormDetails":
         """Create a FormDetails instance from API response data."""
         return cls(
-            id=data["id"],
-            name=data["name"],
-            workspace_id=data["workspaceId"],
-            status=FormStatus(data["status"]),
-            number_of_submissions=data["numberOfSubmissions"],
-            is_closed=data["isClosed"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            **_form_fields(data),
             settings=FormSettings.from_dict(data["settings"]),
             blocks=[FormBlock.from_dict(block) for block in data.get("blocks", [])],
-            payments=[FormPayment.from_dict(payment) for payment in data.get("payments", [])]
-            if data.get("payments")
-            else None,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedForms:
     """Represents a paginated response of forms."""
 
@@ -396,7 +398,7 @@ class PaginatedForms:
     def from_dict(cls, data: dict) -> "PaginatedForms":
         """Create a PaginatedForms instance from API response data."""
         return cls(
-            items=[Form.from_dict(form) for form in data.get("items", [])],
+            items=list(map(Form.from_dict, data.get("items", []))),
             page=data["page"],
             limit=data["limit"],
             total=data["total"],
@@ -421,9 +423,7 @@ class QuestionField:
 
         return cls(
             uuid=data["uuid"],
-            type=BlockType(field_type)
-            if field_type in BlockType.__members__.values()
-            else field_type,
+            type=_BLOCK_TYPES.get(field_type, field_type),
             block_group_uuid=data["blockGroupUuid"],
             title=data["title"],
             has_responses=data["hasResponses"],
@@ -452,16 +452,14 @@ class Question:
 
         return cls(
             id=data["id"],
-            type=BlockType(question_type)
-            if question_type in BlockType.__members__.values()
-            else question_type,
+            type=_BLOCK_TYPES.get(question_type, question_type),
             title=data["title"],
             is_title_modified_by_user=data["isTitleModifiedByUser"],
             form_id=data["formId"],
             is_deleted=data["isDeleted"],
             number_of_responses=data["numberOfResponses"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
             fields=[QuestionField.from_dict(field) for field in data.get("fields", [])],
         )
 
@@ -506,7 +504,7 @@ class Submission:
             id=data["id"],
             form_id=data["formId"],
             is_completed=data["isCompleted"],
-            submitted_at=datetime.fromisoformat(data["submittedAt"].replace("Z", "+00:00")),
+            submitted_at=datetime.fromisoformat(data["submittedAt"]),
             responses=[
                 SubmissionResponse.from_dict(response) for response in data.get("responses", [])
             ],
@@ -577,9 +575,9 @@ class SubmissionDetails:
             id=data["id"],
             form_id=data["formId"],
             is_completed=data["isCompleted"],
-            submitted_at=datetime.fromisoformat(data["submittedAt"].replace("Z", "+00:00")),
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            submitted_at=datetime.fromisoformat(data["submittedAt"]),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
             responses=[
                 SubmissionResponse.from_dict(response) for response in data.get("responses", [])
             ],
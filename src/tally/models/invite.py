@@ -21,6 +21,6 @@ class Invite:
             id=data["id"],
             organization_id=data["organizationId"],
             email=data["email"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
         )
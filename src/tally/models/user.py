@@ -43,8 +43,8 @@ class User:
             organization_id=data["organizationId"],
             is_deleted=data["isDeleted"],
             has_two_factor_enabled=data["hasTwoFactorEnabled"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
             subscription_plan=SubscriptionPlan(data["subscriptionPlan"])
             if "subscriptionPlan" in data
             else None,
@@ -68,11 +68,11 @@ class Webhook:
             event_types=[WebhookEventType(event) for event in data["eventTypes"]],
             external_subscriber=data.get("externalSubscriber"),
             is_enabled=data["isEnabled"],
-            last_synced_at=datetime.fromisoformat(data["lastSyncedAt"].replace("Z", "+00:00"))
+            last_synced_at=datetime.fromisoformat(data["lastSyncedAt"])
             if data.get("lastSyncedAt")
             else None,
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
         )
 
 
@@ -94,7 +94,7 @@ class WebhookCreated:
             url=data["url"],
             event_types=[WebhookEventType(event) for event in data["eventTypes"]],
             is_enabled=data["isEnabled"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
         )
 
 
@@ -127,8 +127,8 @@ class WebhookEvent:
             response=data.get("response"),
             retry=data["retry"],
             payload=data["payload"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
         )
 
 
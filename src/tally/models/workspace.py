@@ -25,12 +25,8 @@ class WorkspaceInvite:
             email=data["email"],
             workspace_ids=data.get("workspaceIds", []),
             created_by_user_id=data.get("createdByUserId"),
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00"))
-            if "createdAt" in data
-            else None,
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00"))
-            if "updatedAt" in data
-            else None,
+            created_at=datetime.fromisoformat(data["createdAt"]) if "createdAt" in data else None,
+            updated_at=datetime.fromisoformat(data["updatedAt"]) if "updatedAt" in data else None,
         )
 
 
@@ -55,8 +51,8 @@ class Workspace:
             members=[User.from_dict(member) for member in data.get("members", [])],
             invites=[WorkspaceInvite.from_dict(invite) for invite in data.get("invites", [])],
             created_by_user_id=data["createdByUserId"],
-            created_at=datetime.fromisoformat(data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updatedAt"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
         )
 
 
@@ -1,8 +1,15 @@
 """Forms resource for the Tally API."""
 
-from collections.abc import Iterator
+import asyncio
+import logging
+import math
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
+from tally.exceptions import ServerError, TallyConnectionError, TallyTimeoutError
 from tally.models.form import (
     Form,
     FormBlock,
@@ -18,19 +25,78 @@ from tally.models.form import (
 )
 
 if TYPE_CHECKING:
+    from tally.cache import CacheBackend
     from tally.client import TallyClient
 
+logger = logging.getLogger(__name__)
+
+
+def _blocks_to_dicts(blocks: list[FormBlock] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Serialize a block list, mapping FormBlock.to_dict directly when it's all FormBlocks."""
+    if all(type(block) is FormBlock for block in blocks):
+        return list(map(FormBlock.to_dict, blocks))
+    return [block.to_dict() if isinstance(block, FormBlock) else block for block in blocks]
+
+
+def _settings_to_dict(settings: FormSettings | dict[str, Any]) -> dict[str, Any]:
+    """Serialize form settings, passing plain dicts through untouched."""
+    return settings.to_dict() if isinstance(settings, FormSettings) else settings
+
 
 class FormsResource:
     """Resource for managing Tally forms."""
 
-    def __init__(self, client: "TallyClient") -> None:
+    def __init__(self, client: "TallyClient", cache: "CacheBackend | None" = None) -> None:
         """Initialize the Forms resource.
 
         Args:
             client: The TallyClient instance
+            cache: Optional cache for raw form listing responses
         """
         self._client = client
+        self._cache = cache
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached form listings after a write so later reads see the change."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @staticmethod
+    def _build_params(
+        page: int, limit: int, workspace_ids: list[str] | None
+    ) -> dict[str, str | int | list[str]]:
+        """Build the query parameters for listing forms."""
+        if workspace_ids is None:
+            return {"page": page, "limit": limit}
+        return {"page": page, "limit": limit, "workspaceIds": workspace_ids}
+
+    def _fetch(
+        self, page: int, limit: int, workspace_ids: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Fetch one page of forms as the raw response data, going through the cache."""
+        cache_key = f"tally:forms:{page}:{limit}:{','.join(sorted(workspace_ids or ()))}"
+        data = self._cache.get(cache_key) if self._cache is not None else None
+
+        if data is None:
+            try:
+                data = self._client.request(
+                    "GET", "/forms", params=self._build_params(page, limit, workspace_ids)
+                )
+            except (TallyConnectionError, TallyTimeoutError, ServerError) as e:
+                # ServerError also covers status codes the client doesn't map, e.g. 409 or 422
+                if isinstance(e, ServerError) and e.status_code < 500:
+                    raise
+
+                # Fall back to an expired copy of this page rather than fail the caller
+                data = self._cache.get(cache_key, stale=True) if self._cache is not None else None
+                if data is None:
+                    raise
+                logger.warning("Listing forms failed, serving stale cached page %d", page)
+            else:
+                if self._cache is not None:
+                    self._cache.set(cache_key, data)
+
+        return data
 
     def all(
         self,
@@ -74,13 +140,142 @@ class FormsResource:
             workspace_forms = client.forms.all(workspace_ids=["ws_123", "ws_456"])
             ```
         """
-        params: dict[str, str | int | list[str]] = {"page": page, "limit": limit}
+        return PaginatedForms.from_dict(self._fetch(page, limit, workspace_ids))
+
+    def count(self, workspace_ids: list[str] | None = None) -> int:
+        """Get the total number of forms.
+
+        Requests a single-form page and reads its total, so no full page of forms
+        is transferred or decoded.
+
+        Args:
+            workspace_ids: Only count forms in these workspaces (optional)
+
+        Returns:
+            Total number of forms
+
+        Example:
+            ```python
+            from tally import Tally
+
+            client = Tally(api_key="tly-xxxx")
+
+            print(f"You have {client.forms.count()} forms")
+            ```
+        """
+        return self._fetch(1, 1, workspace_ids)["total"]
+
+    def all_pages(
+        self,
+        limit: int = 50,
+        workspace_ids: list[str] | None = None,
+        concurrency: int = 8,
+    ) -> Iterator[Form]:
+        """Iterate through all forms, fetching the remaining pages concurrently.
+
+        The first page is fetched to learn the total number of forms, then every
+        remaining page is requested in parallel (at most `concurrency` at a time).
+        Forms are still yielded in page order.
+
+        Args:
+            limit: Number of forms per page (default: 50, max: 500)
+            workspace_ids: Filter forms by specific workspace IDs (optional)
+            concurrency: Maximum number of pages fetched at the same time (default: 8)
 
-        if workspace_ids is not None:
-            params["workspaceIds"] = workspace_ids
+        Yields:
+            Form objects one at a time
 
-        data = self._client.request("GET", "/forms", params=params)
-        return PaginatedForms.from_dict(data)
+        Example:
+            ```python
+            from tally import Tally
+
+            client = Tally(api_key="tly-xxxx")
+
+            # Fetch every form, up to 4 pages at a time
+            for form in client.forms.all_pages(limit=100, concurrency=4):
+                print(f"Form: {form.name}")
+            ```
+        """
+        fetch_page = partial(self._fetch, limit=limit, workspace_ids=workspace_ids)
+        first = fetch_page(1)
+        if not first["hasMore"]:
+            yield from map(Form.from_dict, first.get("items", []))
+            return
+
+        last_page = math.ceil(first["total"] / limit)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            results = executor.map(fetch_page, range(2, last_page + 1))
+
+            yield from map(Form.from_dict, first.get("items", []))
+            for data in results:
+                yield from map(Form.from_dict, data.get("items", []))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def aiter(
+        self,
+        limit: int = 50,
+        workspace_ids: list[str] | None = None,
+        prefetch: int = 4,
+    ) -> AsyncIterator[Form]:
+        """Asynchronously iterate through all forms across all pages.
+
+        Pages are fetched in worker threads so the event loop is never blocked, with up
+        to `prefetch` pages requested ahead of the forms being consumed. Forms are yielded
+        in page order.
+
+        Args:
+            limit: Number of forms per page (default: 50, max: 500)
+            workspace_ids: Filter forms by specific workspace IDs (optional)
+            prefetch: Maximum number of pages fetched ahead at the same time (default: 4)
+
+        Yields:
+            Form objects one at a time
+
+        Example:
+            ```python
+            import asyncio
+
+            from tally import Tally
+
+
+            async def main() -> None:
+                client = Tally(api_key="tly-xxxx")
+
+                async for form in client.forms.aiter(limit=100):
+                    print(f"Form: {form.name}")
+
+
+            asyncio.run(main())
+            ```
+        """
+        fetch_page = partial(self._fetch, limit=limit, workspace_ids=workspace_ids)
+        first = await asyncio.to_thread(fetch_page, 1)
+        last_page = math.ceil(first["total"] / limit) if first["hasMore"] else 1
+
+        pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+        next_page = 2
+        try:
+            while next_page <= last_page and len(pending) < prefetch:
+                pending.append(asyncio.create_task(asyncio.to_thread(fetch_page, next_page)))
+                next_page += 1
+
+            for item in first.get("items", []):
+                yield Form.from_dict(item)
+
+            while pending:
+                data = await pending.popleft()
+                if next_page <= last_page:
+                    pending.append(asyncio.create_task(asyncio.to_thread(fetch_page, next_page)))
+                    next_page += 1
+
+                for item in data.get("items", []):
+                    yield Form.from_dict(item)
+        finally:
+            # Requests already running in a thread finish on their own; their results are dropped
+            for task in pending:
+                task.cancel()
 
     def get(self, form_id: str) -> FormDetails:
         """Get a single form by ID with all its blocks and settings.
@@ -205,9 +400,7 @@ class FormsResource:
         """
         body: dict[str, Any] = {
             "status": status.value if isinstance(status, FormStatus) else status,
-            "blocks": [
-                block.to_dict() if isinstance(block, FormBlock) else block for block in blocks
-            ],
+            "blocks": _blocks_to_dicts(blocks),
         }
 
         if workspace_id is not None:
@@ -217,11 +410,10 @@ class FormsResource:
             body["templateId"] = template_id
 
         if settings is not None:
-            body["settings"] = (
-                settings.to_dict() if isinstance(settings, FormSettings) else settings
-            )
+            body["settings"] = _settings_to_dict(settings)
 
         data = self._client.request("POST", "/forms", json=body)
+        self._invalidate_cache()
         return FormCreated.from_dict(data)
 
     def update(
@@ -288,16 +480,13 @@ class FormsResource:
             body["status"] = status.value if isinstance(status, FormStatus) else status
 
         if blocks is not None:
-            body["blocks"] = [
-                block.to_dict() if isinstance(block, FormBlock) else block for block in blocks
-            ]
+            body["blocks"] = _blocks_to_dicts(blocks)
 
         if settings is not None:
-            body["settings"] = (
-                settings.to_dict() if isinstance(settings, FormSettings) else settings
-            )
+            body["settings"] = _settings_to_dict(settings)
 
         data = self._client.request("PATCH", f"/forms/{form_id}", json=body)
+        self._invalidate_cache()
         return Form.from_dict(data)
 
     def delete(self, form_id: str) -> None:
@@ -319,6 +508,7 @@ class FormsResource:
             ```
         """
         self._client.request("DELETE", f"/forms/{form_id}")
+        self._invalidate_cache()
 
     def list_questions(self, form_id: str) -> list[Question]:
         """Get all questions in a form.
@@ -516,10 +706,65 @@ class FormsResource:
         """
         self._client.request("DELETE", f"/forms/{form_id}/submissions/{submission_id}")
 
+    def iter_forms(
+        self,
+        limit: int = 500,
+        workspace_ids: list[str] | None = None,
+    ) -> Iterator[Form]:
+        """Iterate through all forms across all pages.
+
+        Automatically fetches all pages and yields each form. While the forms of
+        one page are being consumed, the next page is already fetched in the background.
+
+        Pages default to the API maximum of 500 forms: each response is larger, but a full
+        walk needs far fewer round trips, which dominate the cost of listing forms. Lower
+        `limit` if you usually stop after the first few forms.
+
+        Args:
+            limit: Number of forms per page (default: 500, max: 500)
+            workspace_ids: Filter forms by specific workspace IDs
+
+        Yields:
+            Form objects one at a time
+
+        Example:
+            ```python
+            from tally import Tally
+
+            client = Tally(api_key="tly-xxxx")
+
+            for form in client.forms.iter_forms(workspace_ids=["ws_123"]):
+                print(f"Form: {form.name}")
+            ```
+        """
+        fetch_page = partial(self._fetch, limit=limit, workspace_ids=workspace_ids)
+        executor = ThreadPoolExecutor(max_workers=1)
+        submit = executor.submit
+        try:
+            page = 1
+            data = fetch_page(page)
+            # Bound the walk by the reported total too, in case hasMore is ever stale
+            last_page = math.ceil(data["total"] / limit)
+            while True:
+                has_next = data["hasMore"] and data.get("items") and page < last_page
+                next_data = submit(fetch_page, page + 1) if has_next else None
+
+                # Build each Form only when the caller asks for it
+                yield from map(Form.from_dict, data.get("items", []))
+
+                if next_data is None:
+                    break
+
+                data = next_data.result()
+                page += 1
+        finally:
+            # Don't make a caller that stops iterating early wait for the prefetched page
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def __iter__(self) -> Iterator[Form]:
         """Iterate through all forms across all pages.
 
-        Automatically fetches all pages and yields each form.
+        Equivalent to `iter_forms()` with its defaults.
 
         Yields:
             Form objects one at a time
@@ -537,13 +782,4 @@ class FormsResource:
                 print(f"  Submissions: {form.number_of_submissions}")
             ```
         """
-        page = 1
-        while True:
-            result = self.all(page=page)
-
-            yield from result.items
-
-            if not result.has_more:
-                break
-
-            page += 1
+        return self.iter_forms()